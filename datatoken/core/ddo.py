@@ -20,9 +20,11 @@ class DDO:
         self._metadata = {}
         self._services = []
         self._proof = None
+        self._checksum = None
 
         self._asset_type = None
         self._child_dts = None
+        self._is_cdt = False
 
         if not json_text and json_filename:
             with open(json_filename, 'r') as file_handle:
@@ -66,13 +68,18 @@ class DDO:
     @property
     def is_cdt(self):
         """Check cdt or not."""
-        return bool(self._child_dts)
+        return self._is_cdt
 
     @property
     def proof(self):
         """Get the static proof, or None."""
         return self._proof
 
+    @property
+    def checksum(self):
+        """Get the proof checksum as bytes, or None."""
+        return self._checksum
+
     def get_service_by_index(self, index):
         """
         Get service for a given index.
@@ -120,6 +127,7 @@ class DDO:
         self._metadata = values
         self._asset_type = asset_type
         self._child_dts = child_dts
+        self._is_cdt = bool(child_dts)
 
     def add_service(self, value_dict):
         """
@@ -170,6 +178,7 @@ class DDO:
             'created': get_timestamp(),
             'checksum': checksum
         }
+        self._checksum = bytes.fromhex(checksum)
 
         return checksum
 
@@ -4,11 +4,14 @@
 
 import re
 import uuid
+from functools import lru_cache
 from web3 import Web3
 from eth_utils import remove_0x_prefix
 from datatoken.core.utils import convert_to_string
 
 PREFIX = 'dt:ownership:'
+DT_REGEX = re.compile('^dt:([a-z0-9]+):([a-zA-Z0-9-.]+)(.*)')
+DT_CACHE_SIZE = 65536
 
 
 class DTHelper:
@@ -45,6 +48,7 @@ class DTHelper:
         return f'{PREFIX}{dt_id}'
 
     @staticmethod
+    @lru_cache(maxsize=DT_CACHE_SIZE)
     def dt_to_id(dt):
         """Return an id extracted from a dt string."""
         result = DTHelper.dt_parse(dt)
@@ -79,6 +83,7 @@ class DTHelper:
         return id_bytes
 
     @staticmethod
+    @lru_cache(maxsize=DT_CACHE_SIZE)
     def id_bytes_to_dt(id_bytes):
         id = convert_to_string(id_bytes)
         return DTHelper.id_to_dt(id)
@@ -95,7 +100,7 @@ class DTHelper:
             raise TypeError(
                 f'Expecting dt of string type, got {dt} of {type(dt)} type')
 
-        match = re.match('^dt:([a-z0-9]+):([a-zA-Z0-9-.]+)(.*)', dt)
+        match = DT_REGEX.match(dt)
         if not match:
             raise ValueError(f'dt {dt} does not seem to be valid.')
 
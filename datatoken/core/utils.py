@@ -30,13 +30,13 @@ def calc_checksum(seed):
 
         for key, value in dict_value.items():
             if isinstance(value, dict):
-                value = _sort_dict(value)
-                dict_value[key] = value
+                dict_value[key] = _sort_dict(value)
             elif isinstance(value, list):
-                for index, sub_value in enumerate(value):
-                    if isinstance(sub_value, dict):
-                        sub_value = _sort_dict(sub_value)
-                        value[index] = sub_value
+                # only dicts directly inside the list are sorted, deeper
+                # nesting keeps its order, as existing checksums depend on it
+                dict_value[key] = [
+                    _sort_dict(sub_value) if isinstance(sub_value, dict)
+                    else sub_value for sub_value in value]
 
         return dict_value
 
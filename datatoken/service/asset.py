@@ -3,11 +3,12 @@
 # SPDX-License-Identifier: LGPL-2.1-only
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from datatoken.core.ddo import DDO
 from datatoken.core.dt_helper import DTHelper
 from datatoken.store.ipfs_provider import IPFSProvider
-from datatoken.store.asset_resolve import resolve_asset, resolve_asset_by_url
+from datatoken.store.asset_resolve import resolve_asset, resolve_asset_by_url, RESOLVE_WORKERS
 from datatoken.model.keeper import Keeper
 from datatoken.service.verifier import VerifierService
 from datatoken.service.tracer import TracerService
@@ -25,6 +26,8 @@ class AssetService(object):
         self.asset_provider = keeper.asset_provider
         self.verifier = VerifierService(config)
         self.tracer = TracerService(config)
+        self.ipfs_client = IPFSProvider(config, session=True)
+        self.executor = ThreadPoolExecutor(max_workers=RESOLVE_WORKERS)
 
         self.config = config
 
@@ -55,6 +58,17 @@ class AssetService(object):
 
         return ddo
 
+    def generate_ddos(self, specs, verify=True):
+        """
+        Create a batch of asset documents, e.g., to be published with publish_dts.
+
+        :param specs: list of dicts, each with the metadata, services, owner_address
+                      and optional child_dts arguments of generate_ddo
+        :param verify: check the correctness of asset services
+        :return: list of DDO instances
+        """
+        return [self.generate_ddo(verify=verify, **spec) for spec in specs]
+
     def publish_dt(self, ddo, issuer_wallet):
         """
         Publish a ddo to the decentralized storage network and register its 
@@ -64,12 +78,32 @@ class AssetService(object):
         :param issuer_wallet: issuer account, enterprize now
         :return
         """
-        ipfs_client = IPFSProvider(self.config)
-        ipfs_path = ipfs_client.add(ddo.to_dict())
+        ipfs_path = self.ipfs_client.add(ddo.to_dict())
+        self._mint(ddo, ipfs_path, issuer_wallet)
+
+        return
 
+    def publish_dts(self, ddos, issuer_wallet):
+        """
+        Publish a batch of ddos to the decentralized storage network within one
+        request, and then register their data tokens on the smart-contract chain.
+
+        :param ddos: list of asset DDO documents
+        :param issuer_wallet: issuer account, enterprize now
+        :return
+        """
+        ipfs_paths = self.ipfs_client.add_many([ddo.to_dict() for ddo in ddos])
+
+        for ddo, ipfs_path in zip(ddos, ipfs_paths):
+            self._mint(ddo, ipfs_path, issuer_wallet)
+
+        return
+
+    def _mint(self, ddo, ipfs_path, issuer_wallet):
+        """Register the data token of a stored ddo on chain."""
         dt = DTHelper.dt_to_id(ddo.dt)
         owner = ddo.creator
-        isLeaf = not bool(ddo.child_dts)
+        isLeaf = not ddo.is_cdt
         checksum = ddo.proof['checksum']
 
         self.dt_factory.mint_dt(dt, owner, isLeaf, checksum,
@@ -120,13 +154,26 @@ class AssetService(object):
         :param signature: signed by aggregator, [consume_address, cdt]
         :return: bool
         """
-        if self.verifier.check_dt_perm(dt, cdt):
+        if self.verifier.check_dt_perm_cached(dt, cdt):
+            return True
+
+        # the remote reads are independent, so overlap their round-trips
+        perm = self.executor.submit(self.verifier.check_dt_perm, dt, cdt)
+        owner = self.executor.submit(
+            self.verifier.check_dt_owner, dt, owner_address)
+        resolved = self.executor.submit(resolve_asset, cdt, self.dt_factory)
+
+        # drop the reads that are no longer needed if they have not started yet
+        if perm.result():
+            owner.cancel()
+            resolved.cancel()
             return True
 
-        if not self.verifier.check_dt_owner(dt, owner_address):
+        if not owner.result():
+            resolved.cancel()
             return False
 
-        data, cdt_ddo = resolve_asset(cdt, self.dt_factory)
+        data, cdt_ddo = resolved.result()
         if not data or not cdt_ddo:
             return False
 
@@ -144,6 +191,16 @@ class AssetService(object):
 
         return True
 
+    def check_service_terms_batch(self, queries):
+        """
+        Check service agreements for a batch of remote permission authorization
+        requests. Requests signed by the same aggregator recover its address once.
+
+        :param queries: list of (cdt, dt, owner_address, signature) tuples
+        :return: list of bool
+        """
+        return [self.check_service_terms(*query) for query in queries]
+
     def get_dt_marketplace(self):
         """
         Get all available dts in the marketplace.
@@ -154,20 +211,19 @@ class AssetService(object):
 
         issuer_names = self.asset_provider.get_issuer_names(issuers)
 
-        marketplace_list = []
-        for dt, issuer_name, ipfs_path, checksum in zip(dt_idx, issuer_names, ipfs_paths, checksums):
-            ddo = resolve_asset_by_url(ipfs_path)
+        # fetch all ddos concurrently, the loop below only works on local data
+        ddos = list(self.executor.map(resolve_asset_by_url, ipfs_paths))
 
-            if ddo and ddo.metadata['main'].get('type') != "Algorithm":
+        marketplace_list = []
+        for dt, issuer_name, ddo, checksum in zip(dt_idx, issuer_names, ddos, checksums):
+            if ddo and ddo.asset_type != "Algorithm":
                 if self.verifier.verify_ddo_integrity(ddo, checksum):
-                    dt = DTHelper.id_bytes_to_dt(dt)
-                    asset_name = ddo.metadata["main"].get("name")
-                    asset_fig = ddo.metadata['main'].get('fig')
-                    union_or_not = ddo.is_cdt
+                    main = ddo.metadata['main']
 
                     marketplace_list.append(
-                        {"dt": dt, "issuer": issuer_name, "name": asset_name,
-                         "fig": asset_fig, "union_or_not": union_or_not})
+                        {"dt": DTHelper.id_bytes_to_dt(dt), "issuer": issuer_name,
+                         "name": main.get("name"), "fig": main.get("fig"),
+                         "union_or_not": ddo.is_cdt})
 
         return marketplace_list
 
@@ -188,15 +244,9 @@ class AssetService(object):
 
         owner = data[0]
         issuer = data[1]
-        issuer_name = self.asset_provider.get_enterprise(issuer)[0]
-
-        asset_name = ddo.metadata['main'].get('name')
-        asset_desc = ddo.metadata['main'].get('desc')
-        asset_type = ddo.metadata['main'].get('type')
-        asset_fig = ddo.metadata['main'].get('fig')
-
-        dt_info = {"name": asset_name, "owner": owner, "issuer": issuer_name,
-                   "desc": asset_desc, "type": asset_type, "fig": asset_fig}
+        # the issuer lookup does not depend on the union trace below
+        enterprise = self.executor.submit(
+            self.asset_provider.get_enterprise, issuer)
 
         union_data = None
         if ddo.is_cdt:
@@ -205,14 +255,25 @@ class AssetService(object):
             union_data = self.tracer.tree_to_json(tree)
         # self.tracer.print_tree(tree, indent=[], final_node=True)
 
-        service_lists = []
-        for service in ddo.services:
-            sid = service.index
-            op_name = service.attributes.get('op_name')
-            price = service.attributes['price']
-            constrains = service.descriptor
+        issuer_name = enterprise.result()[0]
+
+        asset_name = ddo.metadata['main'].get('name')
+        asset_desc = ddo.metadata['main'].get('desc')
+        asset_type = ddo.metadata['main'].get('type')
+        asset_fig = ddo.metadata['main'].get('fig')
+
+        dt_info = {"name": asset_name, "owner": owner, "issuer": issuer_name,
+                   "desc": asset_desc, "type": asset_type, "fig": asset_fig}
 
-            service_lists.append(
-                {"sid": sid, "op": op_name, "price": price, "constrains": constrains})
+        service_lists = [
+            {"sid": service.index, "op": service.attributes.get('op_name'),
+             "price": service.attributes['price'], "constrains": service.descriptor}
+            for service in ddo.services]
 
         return (dt_info, service_lists, union_data)
+
+    def close(self):
+        """Release the ipfs session and the resolve workers."""
+        self.ipfs_client.close()
+        self.executor.shutdown()
+        self.tracer.close()
@@ -23,6 +23,7 @@ class SystemService:
         self.asset_provider = keeper.asset_provider
         self.op_template = keeper.op_template
         self.verifier = VerifierService(config)
+        self.ipfs_client = IPFSProvider(config, session=True)
 
         self.config = config
 
@@ -78,8 +79,7 @@ class SystemService:
         op.assign_tid(DTHelper.generate_new_dt())
         op.create_proof()
 
-        ipfs_client = IPFSProvider(self.config)
-        ipfs_path = ipfs_client.add(op.to_dict())
+        ipfs_path = self.ipfs_client.add(op.to_dict())
 
         tid = DTHelper.dt_to_id(op.tid)
         name = metadata['main']['name']
@@ -93,3 +93,7 @@ class SystemService:
                 tid, name, checksum, ipfs_path, from_wallet)
 
         return op
+
+    def close(self):
+        """Release the ipfs session."""
+        self.ipfs_client.close()
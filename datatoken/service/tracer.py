@@ -3,9 +3,11 @@
 # SPDX-License-Identifier: LGPL-2.1-only
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from datatoken.core.dt_helper import DTHelper
-from datatoken.store.asset_resolve import resolve_asset
+from datatoken.store.asset_resolve import resolve_asset, RESOLVE_WORKERS
 from datatoken.model.keeper import Keeper
 from datatoken.service.verifier import VerifierService
 
@@ -24,6 +26,7 @@ class TracerService(object):
         self.dt_factory = keeper.dt_factory
         self.task_market = keeper.task_market
         self.verifier = VerifierService(config)
+        self.executor = ThreadPoolExecutor(max_workers=RESOLVE_WORKERS)
 
         self.config = config
 
@@ -79,10 +82,12 @@ class TracerService(object):
         all_paths = []
 
         if ddo.is_cdt:
-            for child_dt in ddo.child_dts:
-                new_path = prefix.copy()
+            # resolve all children of this level concurrently
+            resolved = self.executor.map(
+                partial(resolve_asset, keeper_dt_factory=self.dt_factory), ddo.child_dts)
 
-                _, child_ddo = resolve_asset(child_dt, self.dt_factory)
+            for child_dt, (_, child_ddo) in zip(ddo.child_dts, resolved):
+                new_path = prefix.copy()
 
                 asset_name = child_ddo.metadata["main"].get("name")
 
@@ -130,10 +135,15 @@ class TracerService(object):
             jobs = self.trace_cdt_jobs(dt)
 
             if len(jobs):
+                # look up each distinct solver/demander once, concurrently
+                addresses = list({address for job in jobs for address in (job[1], job[3])})
+                enterprises = dict(
+                    zip(addresses, self.executor.map(self.get_enterprise, addresses)))
+
                 for job in jobs:
                     job_id, solver, task_id, demander, task_name, task_desc = job
-                    demander_info = self.get_enterprise(demander)[0]
-                    solver_info = self.get_enterprise(solver)[0]
+                    demander_info = enterprises[demander][0]
+                    solver_info = enterprises[solver][0]
 
                     text = {"task_name": task_name, "task_desc": task_desc, "solver": solver_info,
                             "demander": demander_info, "task_id": task_id, "job_id": job_id}
@@ -211,16 +221,27 @@ class TracerService(object):
         return root_node
 
     def tree_to_json(self, node):
+        """
+        Convert a hierarchical tree to nested json values, walking it iteratively.
 
-        data = {"values": node.text}
+        :param node: root Node instance
+        :return: dict
+        """
+        root_data = {"values": node.text}
+
+        stack = [(node, root_data)]
+        while stack:
+            node, data = stack.pop()
 
-        if len(node.child_nodes):
-            data["children"] = []
+            if len(node.child_nodes):
+                data["children"] = []
 
-        for n in node.child_nodes:
-            data["children"].append(self.tree_to_json(n))
+            for n in node.child_nodes:
+                child_data = {"values": n.text}
+                data["children"].append(child_data)
+                stack.append((n, child_data))
 
-        return data
+        return root_data
 
     def print_tree(self, node, indent: list, final_node=True):
         """Recursively output the node text and its child node."""
@@ -245,6 +266,10 @@ class TracerService(object):
                 self.print_tree(n, indent, last_node)
                 del indent[-1]
 
+    def close(self):
+        """Release the resolve workers."""
+        self.executor.shutdown()
+
 
 ###################
 class Node:
@@ -3,10 +3,9 @@
 # SPDX-License-Identifier: LGPL-2.1-only
 
 import logging
+from functools import lru_cache
 
-from eth_utils import remove_0x_prefix
 from datatoken.core.dt_helper import DTHelper
-from datatoken.core.utils import convert_to_string
 from datatoken.store.asset_resolve import resolve_asset, resolve_op
 from datatoken.csp.agreement import validate_leaf_template, validate_service_agreement
 from datatoken.model.keeper import Keeper
@@ -15,6 +14,14 @@ from datatoken.web3.utils import personal_ec_recover
 
 logger = logging.getLogger(__name__)
 
+SIGNER_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=SIGNER_CACHE_SIZE)
+def _recover_signer(original_msg, signature):
+    """Recover the signer address, memoized since the recovery is pure."""
+    return personal_ec_recover(original_msg, signature)
+
 
 class VerifierService(object):
     """The entry point for accessing the verifier service."""
@@ -28,6 +35,9 @@ class VerifierService(object):
         self.dt_factory = keeper.dt_factory
         self.task_market = keeper.task_market
 
+        # granted perms can not be revoked, so positive answers stay valid
+        self._granted_perms = set()
+
         self.config = config
 
     def check_admin(self, address):
@@ -62,11 +72,20 @@ class VerifierService(object):
         _cdt = DTHelper.dt_to_id(cdt)
         return self.dt_factory.check_cdt_available(_cdt)
 
+    def check_dt_perm_cached(self, dt, grantee):
+        """Check granted permission from the local cache only."""
+        return (dt, grantee) in self._granted_perms
+
     def check_dt_perm(self, dt, grantee):
-        """Check granted permission."""
+        """Check granted permission on-chain, and remember it when granted."""
         _dt = DTHelper.dt_to_id(dt)
         _grantee = DTHelper.dt_to_id(grantee)
-        return self.dt_factory.check_dt_perm(_dt, _grantee)
+        granted = self.dt_factory.check_dt_perm(_dt, _grantee)
+
+        if granted:
+            self._granted_perms.add((dt, grantee))
+
+        return granted
 
     def check_asset_type(self, ddo, asset_type):
         """Check asset type for a given ddo."""
@@ -74,14 +93,12 @@ class VerifierService(object):
 
     def verify_signature(self, signer_address, signature, original_msg):
         """Check the given address has signed on the given data"""
-        address = personal_ec_recover(original_msg, signature)
+        address = _recover_signer(original_msg, signature)
         return address.lower() == signer_address.lower()
 
     def verify_ddo_integrity(self, ddo, checksum_evidence):
         """Check the equallty of the ddo checksum and its on-chain evidence."""
-        checksum_evidence = remove_0x_prefix(
-            convert_to_string(checksum_evidence))
-        return ddo.proof['checksum'] == checksum_evidence
+        return ddo.checksum == checksum_evidence
 
     def verify_services(self, ddo, wrt_dts=None, integrity_check=True):
         """ 
@@ -138,17 +155,10 @@ class VerifierService(object):
         :param required_dt: dt identifier required to be the cdt child
         :return: bool
         """
-        child_dts = []
-        found = False
-
-        for dt in cdt_ddo.child_dts:
-            child_dts.append(DTHelper.dt_to_id(dt))
-            if dt == required_dt:
-                found = True
-
-        if required_dt and found == False:
+        if required_dt and required_dt not in cdt_ddo.child_dts:
             return False
 
+        child_dts = [DTHelper.dt_to_id(dt) for dt in cdt_ddo.child_dts]
         _cdt = DTHelper.dt_to_id(cdt_ddo.dt)
 
         return self.dt_factory.check_clinks(_cdt, child_dts)
@@ -2,11 +2,40 @@
 # Copyright 2021 The DataToken Authors
 # SPDX-License-Identifier: LGPL-2.1-only
 
+import atexit
+import copy
+import threading
+from collections import OrderedDict
+
 from datatoken.core.ddo import DDO
 from datatoken.core.dt_helper import DTHelper
 from datatoken.core.operator import OpTemplate
 from datatoken.store.ipfs_provider import IPFSProvider
 
+RESOLVED_CACHE_SIZE = 1024
+# threads per service executor that runs resolves and chain reads, sized to
+# the 10 connections the shared ipfs session pools (the requests default);
+# executors busy at the same time can still exceed that, and the surplus
+# connections are then closed after use instead of being kept alive
+RESOLVE_WORKERS = 10
+
+_ipfs_client = None
+_ipfs_client_lock = threading.Lock()
+
+_resolved_ddos = OrderedDict()
+_resolved_ddos_lock = threading.Lock()
+
+
+def get_ipfs_client():
+    """Return the ipfs provider shared by all resolves, connected on first use."""
+    global _ipfs_client
+    with _ipfs_client_lock:
+        if _ipfs_client is None:
+            _ipfs_client = IPFSProvider(session=True)
+            atexit.register(_ipfs_client.close)
+
+    return _ipfs_client
+
 
 def resolve_asset(dt, keeper_dt_factory):
     """
@@ -23,31 +52,53 @@ def resolve_asset(dt, keeper_dt_factory):
     if not (data and data[4]):
         return None, None
 
-    metadata_url = data[4]
-    ipfs_client = IPFSProvider()
-    ddo_json = ipfs_client.get(metadata_url)
-    if not ddo_json:
+    ddo = load_ddo(data[4])
+    if not ddo:
         return data, None
 
-    ddo = DDO()
-    ddo.from_dict(ddo_json)
-
     return data, ddo
 
 
 def resolve_asset_by_url(metadata_url):
+    """
+    Resolve an ipfs cid to its corresponding DDO.
+
+    :param metadata_url: ipfs cid of the asset DDO
+    :return ddo: DDO of the resolved asset, or None
+    """
     if not metadata_url.startswith('Qm'):
         return None
 
-    ipfs_client = IPFSProvider()
-    ddo_json = ipfs_client.get(metadata_url)
-    if not ddo_json:
-        return None
+    return load_ddo(metadata_url)
+
+
+def load_ddo(metadata_url):
+    """
+    Fetch and check a DDO stored on ipfs. Since the cid is content-addressed, the
+    checked DDOs are cached, and every caller gets its own copy.
+
+    :param metadata_url: ipfs cid of the asset DDO
+    :return ddo: DDO instance, or None
+    """
+    with _resolved_ddos_lock:
+        ddo = _resolved_ddos.get(metadata_url)
+        if ddo:
+            _resolved_ddos.move_to_end(metadata_url)
+
+    if not ddo:
+        ddo_json = get_ipfs_client().get(metadata_url)
+        if not ddo_json:
+            return None
+
+        ddo = DDO()
+        ddo.from_dict(ddo_json)
 
-    ddo = DDO()
-    ddo.from_dict(ddo_json)
+        with _resolved_ddos_lock:
+            _resolved_ddos[metadata_url] = ddo
+            if len(_resolved_ddos) > RESOLVED_CACHE_SIZE:
+                _resolved_ddos.popitem(last=False)
 
-    return ddo
+    return copy.deepcopy(ddo)
 
 
 def resolve_op(tid, keeper_op_template):
@@ -67,8 +118,7 @@ def resolve_op(tid, keeper_op_template):
         return None, None
 
     metadata_url = data[3]
-    ipfs_client = IPFSProvider()
-    op_json = ipfs_client.get(metadata_url)
+    op_json = get_ipfs_client().get(metadata_url)
     if not op_json:
         return data, None
 
@@ -2,17 +2,49 @@
 # Copyright 2021 The DataToken Authors
 # SPDX-License-Identifier: LGPL-2.1-only
 
+import io
+import threading
 import ipfshttpclient
+from ipfshttpclient import encoding
+
+# size of each http body write when streaming multipart uploads (the client
+# default is 8 KiB); the daemon still chunks the dag on its own, and small
+# ddos fit in a single write either way
+CHUNK_SIZE = 256 * 1024
 
 class IPFSProvider:
     """Asset storage provider."""
 
-    def __init__(self, config=None):
-        """Initialize the ipfs provider."""
-        if config:
-            self.ipfs_client = ipfshttpclient.connect(config.ipfs_endpoint)
-        else:
-            self.ipfs_client = ipfshttpclient.connect()
+    def __init__(self, config=None, session=False):
+        """
+        Initialize the ipfs provider, the daemon is connected on first use.
+
+        :param config: Config instance, or None for the default endpoint
+        :param session: keep one http session alive for all requests, the
+                        provider must then be closed when no longer needed
+        """
+        self._endpoint = config.ipfs_endpoint if config else None
+        self._session = session
+        self._ipfs_client = None
+        self._lock = threading.Lock()
+
+    @property
+    def ipfs_client(self):
+        """The ipfs http client, connected on first use."""
+        if self._ipfs_client is None:
+            with self._lock:
+                if self._ipfs_client is None:
+                    self._ipfs_client = self._connect()
+
+        return self._ipfs_client
+
+    def _connect(self):
+        if self._endpoint:
+            return ipfshttpclient.connect(
+                self._endpoint, chunk_size=CHUNK_SIZE, session=self._session)
+
+        return ipfshttpclient.connect(
+            chunk_size=CHUNK_SIZE, session=self._session)
 
     def add(self, json):
         """
@@ -24,6 +56,36 @@ class IPFSProvider:
         hash = self.ipfs_client.add_json(json)
         return hash
 
+    def add_many(self, jsons):
+        """
+        Add a batch of asset values to the storage within one multipart request.
+
+        :param jsons: list of dict values
+        :return: list of ipfs cids, in the same order as the given values
+        """
+        if len(jsons) == 0:
+            return []
+        if len(jsons) == 1:
+            return [self.add(jsons[0])]
+
+        # encode as add_json does, so that the cids are identical, and name
+        # each part by its index to map the results back
+        files = []
+        for index, json in enumerate(jsons):
+            file = io.BytesIO(encoding.Json().encode(json))
+            file.name = str(index)
+            files.append(file)
+
+        results = self.ipfs_client.add(*files)
+
+        hashes = {result['Name']: result['Hash'] for result in results}
+        names = [file.name for file in files]
+        if len(results) != len(jsons) or set(hashes) != set(names):
+            raise AssertionError(
+                f'ipfs returned {len(results)} results for {len(jsons)} values')
+
+        return [hashes[name] for name in names]
+
     def get(self, hash):
         """
         Get asset values for a given cid.
@@ -34,5 +96,8 @@ class IPFSProvider:
         return self.ipfs_client.get_json(hash)
 
     def close(self):
-        """Disable the provider"""
-        self.ipfs_client.close()
+        """Disable the provider, a later request connects again."""
+        with self._lock:
+            if self._ipfs_client is not None:
+                self._ipfs_client.close()
+                self._ipfs_client = None
@@ -113,14 +113,15 @@ class Wallet:
         return Wallet._last_tx_count[address]
 
     def sign_tx(self, tx, fixed_nonce=None, gas_price=None):
-        account = self._web3.eth.account.from_key(self.private_key)
+        # the address is derived from the key once, in __init__
+        address = self._address
         if fixed_nonce is not None:
             nonce = fixed_nonce
             logger.debug(
                 f"Signing transaction using a fixed nonce {fixed_nonce}, tx params are: {tx}"
             )
         else:
-            nonce = Wallet._get_nonce(self._web3, account.address)
+            nonce = Wallet._get_nonce(self._web3, address)
 
         if not gas_price:
             gas_price = int(self._web3.eth.gas_price * 1.1)
@@ -130,8 +131,7 @@ class Wallet:
             gas_price = min(gas_price, self._max_gas_price)
 
         logger.debug(
-            f"`Wallet` signing tx: sender address: {account.address} nonce: {nonce}, "
-            f"eth.gasPrice: {self._web3.eth.gas_price}"
+            f"`Wallet` signing tx: sender address: {address} nonce: {nonce}"
         )
         tx["gasPrice"] = gas_price
         tx["nonce"] = nonce
@@ -286,4 +286,8 @@ if tree:
 
 print(tracer_service.get_marketplace_stat())
 print(asset_service.get_dt_details(ddo4.dt))
-print(asset_service.get_dt_marketplace())
\ No newline at end of file
+print(asset_service.get_dt_marketplace())
+
+system_service.close()
+asset_service.close()
+tracer_service.close()
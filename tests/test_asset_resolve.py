@@ -0,0 +1,72 @@
+"""Tests for the resolve cache."""
+
+from collections import OrderedDict
+
+import pytest
+
+from datatoken.core.ddo import DDO
+from datatoken.core.dt_helper import DTHelper
+from datatoken.store import asset_resolve
+
+
+class FakeClient:
+    """Serve stored values by cid and count the fetches."""
+
+    def __init__(self, values):
+        self.values = values
+        self.fetches = []
+
+    def get(self, hash):
+        self.fetches.append(hash)
+        return self.values.get(hash)
+
+
+def _ddo_json():
+    ddo = DDO()
+    ddo.add_metadata({'main': {'name': 'leaf data', 'type': 'Dataset'}})
+    ddo.add_creator('0x0000000000000000000000000000000000000001')
+    ddo.add_service({
+        'index': 'sid0',
+        'endpoint': 'ip:port',
+        'descriptor': {'template': 'dt:ownership:01', 'constraint': {'arg1': 1}},
+        'attributes': {'price': 10}
+    })
+    ddo.assign_dt(DTHelper.generate_new_dt())
+    ddo.create_proof()
+    return ddo.to_dict()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeClient({'QmDDO': _ddo_json()})
+    monkeypatch.setattr(asset_resolve, '_ipfs_client', client)
+    monkeypatch.setattr(asset_resolve, '_resolved_ddos', OrderedDict())
+    return client
+
+
+def test_repeat_resolve_does_not_fetch_again(client):
+    assert asset_resolve.resolve_asset_by_url('QmDDO')
+    assert asset_resolve.resolve_asset_by_url('QmDDO')
+
+    assert client.fetches == ['QmDDO']
+
+
+def test_callers_get_separate_copies(client):
+    first = asset_resolve.resolve_asset_by_url('QmDDO')
+    second = asset_resolve.resolve_asset_by_url('QmDDO')
+
+    assert first is not second
+    assert first.services[0].descriptor is not second.services[0].descriptor
+
+    first.services[0].descriptor['constraint']['arg1'] = 2
+    third = asset_resolve.resolve_asset_by_url('QmDDO')
+    assert second.services[0].descriptor['constraint']['arg1'] == 1
+    assert third.services[0].descriptor['constraint']['arg1'] == 1
+
+
+def test_empty_fetch_is_retried(client):
+    assert asset_resolve.resolve_asset_by_url('QmLate') is None
+
+    client.values['QmLate'] = client.values['QmDDO']
+    assert asset_resolve.resolve_asset_by_url('QmLate')
+    assert client.fetches == ['QmLate', 'QmLate']
@@ -0,0 +1,74 @@
+"""Tests for the IPFS provider."""
+
+import ipfshttpclient
+import pytest
+
+from datatoken.store.ipfs_provider import IPFSProvider
+
+
+class FakeClient:
+    """Answer /add like the daemon, in a configurable order."""
+
+    def __init__(self, reverse=False, drop=0):
+        self.reverse = reverse
+        self.drop = drop
+        self.names = []
+
+    def add(self, *files):
+        results = []
+        for file in files:
+            self.names.append(file.name)
+            results.append({'Name': file.name, 'Hash': f'Qm{file.read().decode()}'})
+        if self.reverse:
+            results.reverse()
+        return results[self.drop:]
+
+    def add_json(self, json):
+        return 'Qmsingle'
+
+    def close(self):
+        self.closed = True
+
+
+def _provider(client):
+    provider = IPFSProvider()
+    provider._ipfs_client = client
+    return provider
+
+
+def test_add_many_maps_results_by_name():
+    client = FakeClient(reverse=True)
+    cids = _provider(client).add_many([{'a': 1}, {'b': 2}, {'c': 3}])
+
+    assert client.names == ['0', '1', '2']
+    assert cids == ['Qm{"a":1}', 'Qm{"b":2}', 'Qm{"c":3}']
+
+
+def test_add_many_rejects_missing_results():
+    with pytest.raises(AssertionError):
+        _provider(FakeClient(drop=1)).add_many([{'a': 1}, {'b': 2}])
+
+
+def test_add_many_single_and_empty():
+    assert _provider(FakeClient()).add_many([{'a': 1}]) == ['Qmsingle']
+    assert _provider(FakeClient()).add_many([]) == []
+
+
+def test_connects_on_first_use(monkeypatch):
+    clients = []
+
+    def connect(*args, **kwargs):
+        clients.append(FakeClient())
+        return clients[-1]
+
+    monkeypatch.setattr(ipfshttpclient, 'connect', connect)
+    provider = IPFSProvider(session=True)
+    provider.close()
+    assert clients == []
+
+    assert provider.add({'a': 1}) == 'Qmsingle'
+    assert provider.add({'b': 2}) == 'Qmsingle'
+    assert len(clients) == 1
+
+    provider.close()
+    assert clients[0].closed
@@ -0,0 +1,51 @@
+"""Tests for the proof checksums."""
+
+import copy
+import hashlib
+import json
+
+import pytest
+
+from datatoken.core.utils import calc_checksum
+
+
+def _legacy_checksum(seed):
+    """Frozen copy of the original calc_checksum, on-chain checksums use it."""
+
+    def _sort_dict(dict_value: dict):
+        dict_value = dict(sorted(dict_value.items(), reverse=False))
+
+        for key, value in dict_value.items():
+            if isinstance(value, dict):
+                value = _sort_dict(value)
+                dict_value[key] = value
+            elif isinstance(value, list):
+                for index, sub_value in enumerate(value):
+                    if isinstance(sub_value, dict):
+                        sub_value = _sort_dict(sub_value)
+                        value[index] = sub_value
+
+        return dict_value
+
+    return hashlib.sha3_256((json.dumps(_sort_dict(seed)).replace(
+        " ", "")).encode('utf-8')).hexdigest()
+
+
+@pytest.mark.parametrize('seed', [
+    {'b': 1, 'a': {'d': [1, 2], 'c': 'x y'}},
+    {'main': {'type': 'Dataset', 'name': 'n'},
+     'files': [{'url': 'u', 'index': 0}, 'raw', 3]},
+    {'main': {'type': 'Dataset', 'name': 'n'},
+     'schema': [[{'name': 'c', 'dtype': 'int'}]]},
+    {'constraint': {'rows': [[{'z': 1, 'a': [{'y': 2, 'b': 3}]}]]}},
+])
+def test_checksum_matches_legacy_form(seed):
+    assert calc_checksum(copy.deepcopy(seed)) == \
+        _legacy_checksum(copy.deepcopy(seed))
+
+
+def test_checksum_leaves_seed_untouched():
+    seed = {'b': [{'d': 1, 'c': 2}], 'a': {'f': 1, 'e': 2}}
+    before = json.dumps(seed)
+    calc_checksum(seed)
+    assert json.dumps(seed) == before
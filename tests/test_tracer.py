@@ -0,0 +1,62 @@
+"""Tests for the tracer tree helpers."""
+
+from datatoken.service.tracer import Node, TracerService
+
+
+def _tracer():
+    # the tree helpers need neither the chain nor ipfs
+    return TracerService.__new__(TracerService)
+
+
+def test_tree_to_json_keeps_nesting_and_child_order():
+    root = Node('root', 0)
+    a, b, c = Node('a', 1), Node('b', 1), Node('c', 1)
+    for child in (a, b, c):
+        root.add_child(child)
+    a1, a2 = Node('a1', 2), Node('a2', 2)
+    a.add_child(a1)
+    a.add_child(a2)
+    c.add_child(Node('c1', 2))
+    a1.add_child(Node('a1x', 3))
+    a1.add_child(Node('a1y', 3))
+
+    assert _tracer().tree_to_json(root) == {
+        'values': 'root',
+        'children': [
+            {'values': 'a', 'children': [
+                {'values': 'a1', 'children': [
+                    {'values': 'a1x'},
+                    {'values': 'a1y'},
+                ]},
+                {'values': 'a2'},
+            ]},
+            {'values': 'b'},
+            {'values': 'c', 'children': [
+                {'values': 'c1'},
+            ]},
+        ]
+    }
+
+
+def test_tree_to_json_from_paths():
+    tracer = _tracer()
+    tree = tracer.tree_format([
+        ['dt0', 'dt1', 'dt3'],
+        ['dt0', 'dt2'],
+        ['dt0', 'dt1', 'dt4', 'dt5'],
+    ])
+
+    assert tracer.tree_to_json(tree) == {
+        'values': 'dt0',
+        'children': [
+            {'values': 'dt1', 'children': [
+                {'values': 'dt3'},
+                {'values': 'dt4', 'children': [{'values': 'dt5'}]},
+            ]},
+            {'values': 'dt2'},
+        ]
+    }
+
+
+def test_tree_to_json_single_node():
+    assert _tracer().tree_to_json(Node('root', 0)) == {'values': 'root'}
@@ -0,0 +1,49 @@
+"""Tests for the verifier permission cache."""
+
+from datatoken.core.dt_helper import DTHelper
+from datatoken.service.verifier import VerifierService
+
+
+class FakeDTFactory:
+    """Answer perm queries from a fixed set and count the chain reads."""
+
+    def __init__(self, granted):
+        self.granted = granted
+        self.queries = []
+
+    def check_dt_perm(self, dt, grantee):
+        self.queries.append((dt, grantee))
+        return (dt, grantee) in self.granted
+
+
+def _verifier(dt_factory):
+    verifier = VerifierService.__new__(VerifierService)
+    verifier.dt_factory = dt_factory
+    verifier._granted_perms = set()
+    return verifier
+
+
+def test_granted_perm_is_cached():
+    dt, cdt = DTHelper.generate_new_dt(), DTHelper.generate_new_dt()
+    dt_factory = FakeDTFactory({(DTHelper.dt_to_id(dt), DTHelper.dt_to_id(cdt))})
+    verifier = _verifier(dt_factory)
+
+    assert not verifier.check_dt_perm_cached(dt, cdt)
+    assert verifier.check_dt_perm(dt, cdt)
+    assert verifier.check_dt_perm_cached(dt, cdt)
+    assert len(dt_factory.queries) == 1
+
+
+def test_missing_perm_still_reads_the_chain():
+    dt, cdt = DTHelper.generate_new_dt(), DTHelper.generate_new_dt()
+    dt_factory = FakeDTFactory(set())
+    verifier = _verifier(dt_factory)
+
+    assert not verifier.check_dt_perm(dt, cdt)
+    assert not verifier.check_dt_perm_cached(dt, cdt)
+
+    # a later grant is seen on the next query
+    dt_factory.granted.add((DTHelper.dt_to_id(dt), DTHelper.dt_to_id(cdt)))
+    assert verifier.check_dt_perm(dt, cdt)
+    assert verifier.check_dt_perm_cached(dt, cdt)
+    assert len(dt_factory.queries) == 2